@@ -1,9 +1,49 @@
 import pdfplumber
+import pypdfium2
 import pandas as pd
 import re
 import wordninja
 import os
 import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+MONTHS = ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')
+
+_YEAR_RE = re.compile(r'\b(20\d{2})\b')
+_NUM_RE = re.compile(r'^\d+(\.\d{1,2})?$')
+
+# Keyword lists per category, in priority order (first match wins)
+CATEGORIES = {
+    "Groceries": ["chitchat super", "no frills", "walmart", "dollarama", "african super"],
+    "Restaurants/Dining": ["subway", "tim hortons", "cineplex", "granville island", "ocean garden",
+                           "shipyards chris"],
+    "Fitness": ["golds gym", "ubc gym", "gym"],
+    "Shopping": ["canadian tire", "amazon", "london drugs", "footlocker", "kindle", "temu"],
+    "Entertainment": ["cineplex", "compass web", "netflix", "amazon prime"],
+    "Transportation": ["driver services", "tennis vancouver", "compass web", "revenue services"],
+    "Education": ["tuition", "ubc botanical", "campus vision", "education ref", "ubc enrolment"],
+    "Error Corrections": ["error correction"],
+    "Light Subscriptions": ["virgin plus", "heroku charge", "kindle"],
+    "Overdraft/Fees": ["overdrawn handling", "overdraft interest"],
+    "Refunds": ["refund"],
+    "Transfers": ["mb transfer"],
+}
+
+# Compiled once at import so every column scan reuses the same pattern;
+# matched against lowercased descriptions
+CATEGORY_PATTERNS = [
+    (label, re.compile('|'.join(re.escape(keyword) for keyword in keywords)))
+    for label, keywords in CATEGORIES.items()
+]
+
+
+@lru_cache(maxsize=200_000)
+def _split_cached(text):
+    """
+    Memoized wordninja segmentation of a single concatenated token.
+    """
+    return " ".join(wordninja.split(text))
 
 
 class DataProcessor:
@@ -12,10 +52,18 @@ class DataProcessor:
     """
 
     DEPOSIT_TRIGS = ['Deposit', 'MB-Transferfrom']
+    COLUMNS = ['Date', 'Description', 'Withdrawals ($)', 'Deposits ($)', 'Balance ($)']
+    PDF_BACKENDS = ['pypdfium2', 'pdfplumber']
+
+    def __init__(self, pdf_backend='pypdfium2'):
+        if pdf_backend not in self.PDF_BACKENDS:
+            raise ValueError(f"Invalid PDF backend. Choose from: {self.PDF_BACKENDS}")
+        self.pdf_backend = pdf_backend
 
     @staticmethod
     def split_concatenated_text(text):
-        return " ".join(wordninja.split(text))
+        # Segment token by token so repeated merchant tokens hit the cache
+        return " ".join(filter(None, map(_split_cached, text.split())))
 
     @staticmethod
     def extract_year(lines):
@@ -25,37 +73,37 @@ class DataProcessor:
         """
 
         for line in lines:
-            year_match = re.search(r'\b(20\d{2})\b', line)
+            year_match = _YEAR_RE.search(line)
             if year_match:
                 return year_match.group(1)
 
         return None
 
-    def extract_transactions(self, lines, extracted_year):
+    def extract_transactions(self, lines, extracted_year, columns=None):
         """
         Extracts structured transactions from lines if text on a page.
-        Returns a list of transactions
+        Appends each field to its per-column list in `columns` (keyed by
+        COLUMNS, created when not given) and returns it.
         """
 
-        transactions = []
-        months = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul",
-                  "Aug", "Sep", "Oct", "Nov", "Dec"]
+        if columns is None:
+            columns = {name: [] for name in self.COLUMNS}
+        dates, descriptions = columns['Date'], columns['Description']
+        withdrawals, deposits = columns['Withdrawals ($)'], columns['Deposits ($)']
+        balances = columns['Balance ($)']
+        found_transaction = False
 
         for line in lines:
             line = line.strip()
-            if any(line.startswith(month) for month in months):
+            if line.startswith(MONTHS):
                 parts = line.split()
                 if not parts[-1].isdigit() and parts[-1].isalpha():
                     del parts[-1]
 
-                # Extract date and add year if available
+                # Extract date and add year if available; parsed in preprocess_transactions
                 date = parts[0]
                 if extracted_year:
                     date = f"{date}{extracted_year}"
-                    try:
-                        date = pd.to_datetime(date, format='%b%d%Y').strftime('%Y-%m-%d')
-                    except ValueError:
-                        continue
 
                 # Extract balance
                 balance = parts[-1]
@@ -70,40 +118,65 @@ class DataProcessor:
 
                 # Extract and clean description
                 description = ' '.join(
-                    [part for part in parts[1:-2] if not re.match(r'^\d+(\.\d{1,2})?$', part)]
+                    [part for part in parts[1:-2] if not _NUM_RE.match(part)]
                 )
                 description = self.split_concatenated_text(description)
 
                 # Append transaction
-                transactions.append([date, description, withdrawal, deposit, balance])
-            elif transactions:
+                dates.append(date)
+                descriptions.append(description)
+                withdrawals.append(withdrawal)
+                deposits.append(deposit)
+                balances.append(balance)
+                found_transaction = True
+            elif found_transaction:
                 # Handle multi-line descriptions
-                transactions[-1][1] += ' ' + self.split_concatenated_text(line)
+                descriptions[-1] += ' ' + self.split_concatenated_text(line)
 
-        return transactions
+        return columns
 
 
+    def _extract_lines(self, file_path):
+        """
+        Yields the text lines of each page in a PDF file, one list per page.
+        Uses PDFium for plain text extraction; the pdfplumber backend is kept
+        for regression comparisons.
+        """
+        if self.pdf_backend == 'pdfplumber':
+            with pdfplumber.open(file_path) as pdf:
+                for page in pdf.pages:
+                    text = page.extract_text() or ''
+                    # Release the page's parsed layout so only one page is held at a time
+                    page.close()
+                    yield text.split('\n')
+            return
+
+        pdf = pypdfium2.PdfDocument(file_path)
+        try:
+            for page in pdf:
+                textpage = page.get_textpage()
+                text = textpage.get_text_range()
+                textpage.close()
+                page.close()
+                yield text.splitlines()
+        finally:
+            pdf.close()
+
     def process_pdf(self, file_path):
         """
         Extracts transactions from a single PDF file.
         Returns a pandas DataFrame.
         """
-        transactions = []
-
-        with pdfplumber.open(file_path) as pdf:
-            extracted_year = None
+        columns = {name: [] for name in self.COLUMNS}
+        extracted_year = None
 
-            for page in pdf.pages:
-                text = page.extract_text()
-                lines = text.split('\n')
+        for lines in self._extract_lines(file_path):
+            if not extracted_year:
+                extracted_year = self.extract_year(lines)
 
-                if not extracted_year:
-                    extracted_year = self.extract_year(lines)
+            self.extract_transactions(lines, extracted_year, columns)
 
-                transactions.extend(self.extract_transactions(lines, extracted_year))
-
-        columns = ['Date', 'Description', 'Withdrawals ($)', 'Deposits ($)', 'Balance ($)']
-        return self.preprocess_transactions(pd.DataFrame(transactions, columns=columns))
+        return self.preprocess_transactions(pd.DataFrame(columns, dtype=object))
 
     # Quick validation when running data_processor.py independently
 
@@ -133,11 +206,11 @@ class DataProcessor:
         df.loc[df['withdrawals'] == 'ClosingBalance', 'withdrawals'] = np.nan
 
         # Convert numeric columns
-        for col in ['withdrawals', 'deposits', 'balance']:
-            df[col] = df[col].str.replace(',', '').str.replace('$', '').astype(np.float32)
+        numeric_cols = ['withdrawals', 'deposits', 'balance']
+        df[numeric_cols] = df[numeric_cols].replace(r'[,$]', '', regex=True).astype(np.float32)
 
-        # Convert date column to datetime
-        df['date'] = pd.to_datetime(df['date'], errors='coerce')
+        # Convert raw 'MmmDDYYYY' dates to datetime in a single fixed-format pass
+        df['date'] = pd.to_datetime(df['date'], format='%b%d%Y', errors='coerce')
 
         # Drop rows with invalid dates or balances
         df = df.dropna(subset=['date', 'balance'])
@@ -147,110 +220,97 @@ class DataProcessor:
         df = df[df['description'] != 'Closing Balance']
 
         # Add transaction type
-        df['transaction_type'] = df.apply(
-            lambda row: 'withdrawal' if pd.notna(row['withdrawals']) and row['withdrawals'] > 0
-            else 'deposit' if pd.notna(row['deposits']) and row['deposits'] > 0
-            else 'unknown',
-            axis=1
+        withdrawals = np.nan_to_num(df['withdrawals'].to_numpy())
+        deposits = np.nan_to_num(df['deposits'].to_numpy())
+        df['transaction_type'] = pd.Categorical(
+            np.select([withdrawals > 0, deposits > 0], ['withdrawal', 'deposit'], default='unknown'),
+            categories=['withdrawal', 'deposit', 'unknown']
         )
 
         # Add date-related derived columns
-        df['day'] = df['date'].dt.day
-        df['month'] = df['date'].dt.month
-        df['year'] = df['date'].dt.year
-        df['day_of_week'] = df['date'].dt.dayofweek
-
-
-        def categorize_transaction(description):
-            description = description.lower()
-            if any(keyword in description for keyword in
-                   ["chitchat super", "no frills", "walmart", "dollarama", "african super"]):
-                return "Groceries"
-            elif any(keyword in description for keyword in
-                     ["subway", "tim hortons", "cineplex", "granville island", "ocean garden", "shipyards chris"]):
-                return "Restaurants/Dining"
-            elif any(keyword in description for keyword in ["golds gym", "ubc gym","gym"]):
-                return "Fitness"
-            elif any(keyword in description for keyword in
-                     ["canadian tire", "amazon", "london drugs", "footlocker", "kindle","temu"]):
-                return "Shopping"
-            elif any(keyword in description for keyword in
-                     ["cineplex", "compass web", "netflix", "amazon prime"]):
-                return "Entertainment"
-            elif any(keyword in description for keyword in
-                     ["driver services", "tennis vancouver", "compass web", "revenue services"]):
-                return "Transportation"
-            elif any(keyword in description for keyword in
-                     ["tuition", "ubc botanical", "campus vision", "education ref", "ubc enrolment"]):
-                return "Education"
-            elif "error correction" in description:
-                return "Error Corrections"
-            elif any(keyword in description for keyword in ["virgin plus", "heroku charge", "kindle"]):
-                return "Light Subscriptions"
-            elif any(keyword in description for keyword in ["overdrawn handling", "overdraft interest"]):
-                return "Overdraft/Fees"
-            elif "refund" in description:
-                return "Refunds"
-            elif "mb transfer" in description:
-                return "Transfers"
-            elif description.isnumeric() and float(description) > 1000:  # Example large purchase threshold
-                return "Large Purchases"
-            else:
-                return "Other"
-
-        df['category'] = df['description'].apply(categorize_transaction)
+        df['day'] = df['date'].dt.day.astype(np.int8)
+        df['month'] = df['date'].dt.month.astype(np.int8)
+        df['year'] = df['date'].dt.year.astype(np.int16)
+        df['day_of_week'] = df['date'].dt.dayofweek.astype(np.int8)
 
-        df['is_recurring'] = df.groupby(['description','month','year'])['description'].transform('count') > 1
 
-        # Add alerts for balance thresholds
-        df['low_balance_alert'] = df['balance'] < 100
-        df['critical_balance_alert'] = df['balance'] < 20
-        df['overdraft_alert'] = df['balance'] < 0
+        # Categorize transactions; the first matching category wins
+        desc_lower = df['description'].fillna('').str.lower()
+        masks = [desc_lower.str.contains(pattern, regex=True) for _, pattern in CATEGORY_PATTERNS]
+        # Example large purchase threshold for bare numeric descriptions
+        masks.append(desc_lower.str.fullmatch(r'\d+') & (pd.to_numeric(desc_lower, errors='coerce') > 1000))
+        labels = [label for label, _ in CATEGORY_PATTERNS] + ['Large Purchases']
+        df['category'] = pd.Categorical(np.select(masks, labels, default='Other'),
+                                        categories=labels + ['Other'])
 
-        # Add flags for large transactions
-        df['is_large_withdrawal'] = df['withdrawals'] > 10000
-        df['is_large_deposit'] = df['deposits'] > 10000
+        df['is_recurring'] = df.groupby(['description','month','year'])['description'].transform('count') > 1
+
+        # Add alerts for balance thresholds and flags for large transactions,
+        # computed on the underlying arrays and assigned in one step
+        balance = df['balance'].to_numpy()
+        df = df.assign(
+            low_balance_alert=balance < 100,
+            critical_balance_alert=balance < 20,
+            overdraft_alert=balance < 0,
+            is_large_withdrawal=withdrawals > 10000,
+            is_large_deposit=deposits > 10000
+        )
 
-        df['month_withdrawals'] = df.groupby(['month','year'])['withdrawals'].transform('sum')
-        df['monthly_deposits'] = df.groupby(['month','year'])['deposits'].transform('sum')
-        df['monthly_start_balance'] = df.groupby(['month','year'])['balance'].transform('first')
-        df['monthly_end_balance'] = df.groupby(['month','year'])['balance'].transform('last')
+        # Monthly aggregates computed in a single grouping pass
+        monthly = df.groupby(['month','year'], sort=False).agg(
+            month_withdrawals=('withdrawals', 'sum'),
+            monthly_deposits=('deposits', 'sum'),
+            monthly_start_balance=('balance', 'first'),
+            monthly_end_balance=('balance', 'last')
+        )
+        df = df.join(monthly, on=['month','year'])
         df['monthly_balance_change'] = df['monthly_end_balance'] - df['monthly_start_balance']
 
-        df['seasonal_spending'] = df['month'].isin([11,12]) | df['month'].isin([8,9])
+        df['seasonal_spending'] = np.isin(df['month'].to_numpy(), [8, 9, 11, 12])
 
         # Add refund and error correction flags
-        df['is_refund'] = df['description'].str.contains('refund', case=False, na=False)
-        df['is_error_correction'] = df['description'].str.contains('error correction', case=False, na=False)
+        df['is_refund'] = desc_lower.str.contains('refund', regex=False)
+        df['is_error_correction'] = desc_lower.str.contains('error correction', regex=False)
 
         print(f"Preprocessed DataFrame – {len(df)} valid transactions with enriched features.")
 
         return df
 
-    def process_directory(self, directory_path):
+    def process_directory(self, directory_path, max_workers=None):
         """
         Processes all PDF files in a directory and consolidates transactions.
+        Files are processed in parallel across `max_workers` processes
+        (defaults to the number of CPUs).
         Returns a single pandas DataFrame with all transactions.
         """
-        all_transactions = pd.DataFrame()
-        file_count = 0
-
-        for file_name in os.listdir(directory_path):
-            if file_name.endswith('.pdf'):
-                file_path = os.path.join(directory_path, file_name)
+        file_paths = [os.path.join(directory_path, file_name)
+                      for file_name in os.listdir(directory_path) if file_name.endswith('.pdf')]
+        frames = []
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [(file_path, executor.submit(_process_pdf_file, file_path, self.pdf_backend))
+                       for file_path in file_paths]
+            for file_path, future in futures:
                 try:
-                    transactions = self.process_pdf(file_path)
-                    all_transactions = pd.concat([all_transactions, transactions], ignore_index=True)
-                    file_count += 1
+                    frames.append(future.result())
                 except Exception as e:
                     print(f"Error processing file {file_path}: {e}")
 
+        file_count = len(frames)
         if file_count == 0:
             print(f"No PDF files found in directory: {directory_path}")
         else:
             print(f"Processed {file_count} files from {directory_path}.")
 
-        return all_transactions
+        return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+
+
+def _process_pdf_file(file_path, pdf_backend):
+    """
+    Top-level (picklable) entry point used by worker processes in
+    DataProcessor.process_directory.
+    """
+    return DataProcessor(pdf_backend).process_pdf(file_path)
 
 
 # Run as standalone script for validation
@@ -1,38 +1,64 @@
 import pandas as pd
+import numpy as np
 from datetime import datetime, timedelta
-import re
+import ahocorasick
+from functools import lru_cache
+
+def _last_week(today):
+    start_date = today - timedelta(days=7)
+    return start_date, start_date + timedelta(days=6)
+
+
+def _this_month(today):
+    return today.replace(day=1), today
+
+
+def _last_month(today):
+    end_date = today.replace(day=1) - timedelta(days=1)
+    return end_date - timedelta(days=30), end_date
+
+
+def _last_year(today):
+    return today.replace(month=1, day=1), today
+
+
+# Relative date phrases mapped to functions returning (start_date, end_date)
+_RELATIVE_DATES = {
+    'last week': _last_week,
+    'this month': _this_month,
+    'last month': _last_month,
+    'last year': _last_year,
+}
 
 class TransactionQueryParser:
     def __init__(self, df):
-        self.df = df
-        self.df['date'] = pd.to_datetime(self.df['date'])
-        self.df['deposits'] = self.df['deposits'].astype(float)
-        self.df['withdrawals'] = self.df['withdrawals'].astype(float)
+        # Convert only the columns that need it; assign leaves the caller's frame untouched
+        conversions = {}
+        if not pd.api.types.is_datetime64_any_dtype(df['date']):
+            conversions['date'] = pd.to_datetime(df['date'])
+        for col in ['deposits', 'withdrawals']:
+            if not pd.api.types.is_float_dtype(df[col]):
+                conversions[col] = df[col].astype(float)
+
+        # Keep rows sorted by date so range queries reduce to binary searches
+        self.df = df.assign(**conversions).sort_values('date', kind='stable').reset_index(drop=True)
+        self._dates = self.df['date'].to_numpy()
+        self._valid_dates = int(self.df['date'].notna().sum())  # NaT rows sort last
+        self._desc_lower = self.df['description'].fillna('').astype(str).str.lower().to_numpy()
+        self._has_desc = self.df['description'].notna().to_numpy()
+        # The frame is not modified after construction, so query results can be memoized
+        self._date_bounds = lru_cache(maxsize=128)(self._date_bounds_impl)
+        self._description_mask = lru_cache(maxsize=128)(self._description_mask_impl)
         print('Transaction Dataframe loaded successfully!')
 
     @staticmethod
     def parse_relative_dates(relative_date):
-        today = datetime.now()
-
-        if re.match('last week', relative_date, re.IGNORECASE):
-            start_date = today - timedelta(days=7)
-            end_date =  start_date + timedelta(days=6)
-        elif re.match('this month', relative_date, re.IGNORECASE):
-            start_date = today - timedelta(days=today.weekday())
-            end_date = today
-        elif re.match('last month', relative_date, re.IGNORECASE):
-            first_day_this_month = today.replace(day=1)
-            end_date = first_day_this_month - timedelta(days=1)
-            start_date = end_date - timedelta(days=30)
-        elif re.match('this month', relative_date, re.IGNORECASE):
-            start_date = today.replace(day=1)
-            end_date = today
-        elif re.match('last year', relative_date, re.IGNORECASE):
-            start_date = today.replace(month=1, day=1)
-            end_date = today
-        else:
+        date_range = _RELATIVE_DATES.get(relative_date.strip().lower())
+        if not date_range:
             raise ValueError(f"Invalid relative date: {relative_date}")
 
+        start_date, end_date = date_range(datetime.now())
+
         return start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d')
 
     def filter_by_date(self, start_date=None, end_date=None):
@@ -40,25 +66,55 @@ class TransactionQueryParser:
         if start_date and isinstance(start_date, str) and " " in start_date:
             start_date, end_date = self.parse_relative_dates(start_date)
 
-        df_filtered = self.df
+        lo, hi = self._date_bounds(start_date, end_date)
+        df_filtered = self.df.iloc[lo:hi]
+        print(f"Filtered {len(df_filtered)} rows between {start_date} and {end_date}.")
+        return df_filtered
 
+    def _date_bounds_impl(self, start_date, end_date):
+        """
+        Returns the (lo, hi) positional slice bounds of rows dated between
+        start_date and end_date (inclusive), found by binary search.
+        """
+        lo, hi = 0, len(self._dates)
+        if start_date or end_date:
+            hi = self._valid_dates
         if start_date:
-            df_filtered = df_filtered[df_filtered['date'] >= pd.to_datetime(start_date)]
+            lo = int(np.searchsorted(self._dates[:hi], pd.to_datetime(start_date).to_datetime64(), 'left'))
         if end_date:
-            df_filtered = df_filtered[df_filtered['date'] <= pd.to_datetime(end_date)]
-        print(f"Filtered {len(df_filtered)} rows between {start_date} and {end_date}.")
-        return df_filtered
+            hi = int(np.searchsorted(self._dates[:hi], pd.to_datetime(end_date).to_datetime64(), 'right'))
+
+        return lo, hi
 
     def filter_by_description(self, keywords):
         if isinstance(keywords, str):
             keywords = [keywords]
 
-        pattern = '|'.join(re.escape(keyword) for keyword in keywords)
-        df_filtered = self.df[self.df['description'].str.contains(pattern, case=False, na=False)]
-        # df_filtered = self.df[self.df['description'].str.contains(keyword, case=False, na=False)]
+        mask = self._description_mask(tuple(sorted({keyword.lower() for keyword in keywords})))
+        df_filtered = self.df[mask]
         print(f"Found {len(df_filtered)} rows matching keywords: {keywords}.")
         return df_filtered
 
+    def _description_mask_impl(self, keywords):
+        """
+        Returns a boolean mask of rows whose description contains any of the
+        lowercase keywords, using a single Aho-Corasick pass per row.
+        """
+        # An empty pattern matches every row that has a description
+        if not keywords or '' in keywords:
+            return self._has_desc
+
+        automaton = ahocorasick.Automaton()
+        for keyword in keywords:
+            automaton.add_word(keyword, keyword)
+        automaton.make_automaton()
+
+        return np.fromiter(
+            (next(automaton.iter(description), None) is not None for description in self._desc_lower),
+            dtype=bool,
+            count=len(self._desc_lower)
+        )
+
     def get_total_amount(self, transaction_type='withdrawals', start_date=None, end_date=None):
         df_filtered = self.filter_by_date(start_date, end_date)
         total = df_filtered[transaction_type].sum()
@@ -69,10 +125,15 @@ class TransactionQueryParser:
         valid_transaction_types = ['withdrawals', 'deposits']
 
         if transaction_type not in valid_transaction_types:
-            return ValueError(f"Invalid transaction type. Choose from: {valid_transaction_types}")
+            raise ValueError(f"Invalid transaction type. Choose from: {valid_transaction_types}")
+
+        amounts = self.df[transaction_type].to_numpy()
+        if np.isnan(amounts).all():
+            print(f"No {transaction_type} found.")
+            return None
 
-        largest_transaction = self.df[transaction_type].idxmax()
-        print(f"Largest {transaction_type}: ${largest_transaction:,.2f}")
+        largest_transaction = self.df.iloc[int(np.nanargmax(amounts))]
+        print(f"Largest {transaction_type}: ${largest_transaction[transaction_type]:,.2f}")
         return largest_transaction
 
     def query(self, query_type, **kwargs):
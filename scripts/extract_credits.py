@@ -1,8 +1,13 @@
-import pdfplumber
 import pandas as pd
+import numpy as np
 import re
 import wordninja
-import os
+from pdf_text import extract_text_pages, map_pdfs_in_directory
+
+_YEAR_RE = re.compile(r"\s[A-Za-z]{3}\s\d{1,2},\s(\d{4})")
+# Statement dates sit in the page header, so look there before scanning the whole page
+_YEAR_SEARCH_WINDOW = 512
+_TXN_RE = re.compile(r"(\d{3})\s([A-Za-z]{3}\s\d{1,2})\s([A-Za-z]{3}\s\d{1,2})\s([\w\s\*\-\/\.,]+?)\s([\d,]+\.\d{2}(?:-|\d+)?)")
 
 
 # def extract_year(text):
@@ -18,45 +23,45 @@ def extract_transactions_from_pdf(pdf_file):
     Extract transactions from a financial statement PDF based on the pattern:
     Date (with year), Description, Withdrawn ($), Deposited ($), Balance ($).
     """
-    transactions = []
     extracted_year = None  # Variable to store the extracted year
 
-    with pdfplumber.open(pdf_file) as pdf:
-        data = []
+    statement_year = None  # Variable to hold the statement year
+    dates, descriptions, amounts = [], [], []
+
+    for page_number, text in enumerate(extract_text_pages(pdf_file), start=1):
+        print(f"Processing page {page_number}...")
 
-        statement_year = None  # Variable to hold the statement year
-        for page_number, page in enumerate(pdf.pages, start=1):
-            text = page.extract_text()
-            print(f"Processing page {page_number}...")
+        # Find the year if not already found
+        if statement_year is None:
+            year_match = _YEAR_RE.search(text, 0, _YEAR_SEARCH_WINDOW) or _YEAR_RE.search(text)
+            if year_match:
+                statement_year = int(year_match.group(1))
+                print(f"Extracted Year: {statement_year}")
+            else:
+                print("Year not found on this page!")
 
-            # Find the year if not already found
-            if statement_year is None:
-                year_match = re.search(r"\s[A-Za-z]{3}\s\d{1,2},\s(\d{4})", text)
-                if year_match:
-                    statement_year = int(year_match.group(1))
-                    print(f"Extracted Year: {statement_year}")
-                else:
-                    print("Year not found on this page!")
+        # Extract transactions based on your pattern straight into the column lists
+        for match in _TXN_RE.finditer(text):
+            reference, trans_date, post_date, description, amount = match.groups()
+            dates.append(trans_date)
+            descriptions.append(description)
+            amounts.append(amount)
 
-            # Extract transactions based on your pattern (ensure the year is used)
-            transaction_pattern = r"(\d{3})\s([A-Za-z]{3}\s\d{1,2})\s([A-Za-z]{3}\s\d{1,2})\s([\w\s\*\-\/\.,]+?)\s([\d,]+\.\d{2}(?:-|\d+)?)"
-            transactions += re.findall(transaction_pattern, text)
+    # Only append the year if it has been found
+    dates = pd.Series(dates, dtype=object)
+    if statement_year is not None:
+        dates = dates + f" {statement_year}"
 
-        # Process transactions found
-        for transaction in transactions:
-            reference, trans_date, post_date, description, amount = transaction
-            # Only append the year if it has been found
-            if statement_year is not None:
-                trans_date = f"{trans_date} {statement_year}"
-            amount = float(amount.replace(',', '').replace('-', ''))
+    # Strip thousands separators and credit markers, then parse all amounts at once
+    amounts = np.array(amounts, dtype=str)
+    if amounts.size:
+        amounts = np.char.replace(np.char.replace(amounts, ',', ''), '-', '')
+    amounts = amounts.astype(np.float64)
 
-            data.append({
-                'date': trans_date,
-                'description': description.strip(),  # Clean up whitespace
-                'amount': amount,
-            })
+    # Clean up whitespace in one vectorized pass
+    descriptions = pd.Series(descriptions, dtype=object).str.strip()
 
-        return pd.DataFrame(data)
+    return pd.DataFrame({'date': dates, 'description': descriptions, 'amount': amounts})
 
 
 def process_all_pdfs_in_directory(directory_path):
@@ -64,17 +69,10 @@ def process_all_pdfs_in_directory(directory_path):
     Reads all PDF files in a specified directory and extracts transactions.
     Returns a single consolidated DataFrame of all transactions.
     """
-    all_transactions = pd.DataFrame()
-
-    for file_name in os.listdir(directory_path):
-        if file_name.endswith('.pdf'):
-            file_path = os.path.join(directory_path, file_name)
-            print(f"Processing file: {file_name}")
-            transactions = extract_transactions_from_pdf(file_path)
-            # print(transactions)
-            all_transactions = pd.concat([all_transactions, transactions], ignore_index=True)
+    frames = map_pdfs_in_directory(directory_path, extract_transactions_from_pdf)
 
-    return all_transactions
+    columns = ['date', 'description', 'amount']
+    return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=columns)
 
 
 
@@ -85,4 +83,3 @@ if __name__ == "__main__":
     # Extract transactions into a DataFrame
     transactions_df = process_all_pdfs_in_directory(path)
     transactions_df.to_csv("../data/processed/credit-transactions.csv", index=False)
-transactions_df
\ No newline at end of file
@@ -1,15 +1,21 @@
-import pdfplumber
 import pandas as pd
 import re
-import wordninja
 import os
 import argparse
+from pdf_text import extract_text_pages, map_pdfs_in_directory, split_concatenated_text
 
 DEPOSIT_TRIGS = ['Deposit', 'MB-Transferfrom']
-
-def split_concatenated_text(text):
-    """Splits concatenated text into readable words using wordninja."""
-    return " ".join(wordninja.split(text))
+_DEPOSIT_SET = frozenset(DEPOSIT_TRIGS)
+
+# A transaction line in one match: a date token starting with the month ('Jan03'), the
+# description body, then amount and balance, plus an optional trailing all-letter marker
+# (e.g. 'CR') that is ignored
+_LINE_RE = re.compile(
+    r'^(?P<date>(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\S*)'
+    r'(?P<body>(?:\s+\S+)*?)\s+(?P<amount>\S+)\s+(?P<balance>\S+)(?:\s+[^\W\d_]+)?$'
+)
+_NUM_RE = re.compile(r'\A\d+(?:\.\d{1,2})?\Z')
+_YEAR_RE = re.compile(r'\b(20\d{2})\b')
 
 def extract_year(lines):
     """
@@ -17,7 +23,7 @@ def extract_year(lines):
     Returns the first valid 4-digit year found or None if no year is detected.
     """
     for line in lines:
-        year_match = re.search(r'\b(20\d{2})\b', line)
+        year_match = _YEAR_RE.search(line)
         if year_match:
             return year_match.group(1)
     return None
@@ -25,39 +31,32 @@ def extract_year(lines):
 def extract_transactions_from_page(lines, extracted_year):
     """
     Extracts transaction records from lines of text on a single page.
-    Returns a list of structured transactions.
+    Returns a list of structured transactions; dates are kept raw ('Jan03') alongside
+    the statement year and parsed per file in process_single_pdf.
     """
     transactions = []
-    months = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
 
     for line in lines:
         line = line.strip()
-        if any(line.startswith(month) for month in months):
-            parts = line.split()
-            if not parts[-1].isdigit() and parts[-1].isalpha():
-                del parts[-1]
-
-            date = parts[0]
-            if extracted_year:
-                date = f"{date}{extracted_year}"
-                try:
-                    date = pd.to_datetime(date, format='%b%d%Y').strftime('%b %d, %Y')
-                except ValueError:
-                    continue
-
-            balance = parts[-1]
-            if any(tag in parts for tag in DEPOSIT_TRIGS):
-                deposit = parts[-2]
+        match = _LINE_RE.match(line)
+        if match:
+            body = match.group('body').split()
+            if not _DEPOSIT_SET.isdisjoint(body):
+                deposit = match.group('amount')
                 withdrawal = None
             else:
                 deposit = None
-                withdrawal = parts[-2]
+                withdrawal = match.group('amount')
 
-            description = ' '.join([part for part in parts[1:-2] if not re.match(r'^\d+(\.\d{1,2})?$', part)])
-            description = split_concatenated_text(description)
-            transactions.append([date, description, withdrawal, deposit, balance])
+            # Raw description pieces; continuation lines are added and segmented below
+            description = [part for part in body if not _NUM_RE.match(part)]
+            transactions.append([match.group('date'), description, withdrawal, deposit,
+                                 match.group('balance'), extracted_year])
         elif transactions:
-            transactions[-1][1] += ' ' + split_concatenated_text(line)
+            transactions[-1][1].append(line)
+
+    for transaction in transactions:
+        transaction[1] = split_concatenated_text(' '.join(transaction[1]))
 
     return transactions
 
@@ -68,36 +67,45 @@ def process_single_pdf(file_path):
     """
     transactions = []
 
-    with pdfplumber.open(file_path) as pdf:
-        extracted_year = None
+    extracted_year = None
 
-        for page in pdf.pages:
-            text = page.extract_text()
-            lines = text.split('\n')
+    for text in extract_text_pages(file_path):
+        lines = text.splitlines()
 
-            if not extracted_year:
-                extracted_year = extract_year(lines)
+        if not extracted_year:
+            extracted_year = extract_year(lines)
 
-            transactions.extend(extract_transactions_from_page(lines, extracted_year))
+        transactions.extend(extract_transactions_from_page(lines, extracted_year))
 
-    columns = ['Date', 'Description', 'Withdrawals ($)', 'Deposits ($)', 'Balance ($)']
-    return pd.DataFrame(transactions, columns=columns)
+    columns = ['Date', 'Description', 'Withdrawals ($)', 'Deposits ($)', 'Balance ($)', '_year']
+    df = pd.DataFrame(transactions, columns=columns)
+
+    # Parse all dated rows in one vectorized call and drop the ones that don't parse;
+    # rows seen before the statement year was found have no full date and are left as NaT
+    has_year = df['_year'].notna()
+    df['Date'] = pd.to_datetime(df['Date'] + df['_year'].fillna(''), format='%b%d%Y', errors='coerce', cache=True)
+    df = df[df['Date'].notna() | ~has_year].reset_index(drop=True)
+
+    # Balance marker rows carry their label in the withdrawal slot; move it into the description
+    # so the row stays identifiable once the amount is coerced to NaN below
+    df.loc[df['Withdrawals ($)'] == 'OpeningBalance', 'Description'] = 'Opening Balance'
+    df.loc[df['Withdrawals ($)'] == 'ClosingBalance', 'Description'] = 'Closing Balance'
+
+    # Explicit float64 amounts; non-numeric tokens become NaN
+    amount_cols = ['Withdrawals ($)', 'Deposits ($)', 'Balance ($)']
+    df[amount_cols] = df[amount_cols].replace(',', '', regex=True).apply(pd.to_numeric, errors='coerce')
+    df = df.astype({col: 'float64' for col in amount_cols})
+    return df.drop(columns='_year')
 
 def process_all_pdfs_in_directory(directory_path):
     """
     Reads all PDF files in a specified directory and extracts transactions.
     Returns a single consolidated DataFrame of all transactions.
     """
-    all_transactions = pd.DataFrame()
+    frames = map_pdfs_in_directory(directory_path, process_single_pdf)
 
-    for file_name in os.listdir(directory_path):
-        if file_name.endswith('.pdf'):
-            file_path = os.path.join(directory_path, file_name)
-            print(f"Processing file: {file_name}")
-            transactions = process_single_pdf(file_path)
-            all_transactions = pd.concat([all_transactions, transactions], ignore_index=True)
-
-    return all_transactions
+    columns = ['Date', 'Description', 'Withdrawals ($)', 'Deposits ($)', 'Balance ($)']
+    return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=columns)
 
 if __name__ == "__main__":
 
@@ -0,0 +1,76 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+import pypdfium2
+import wordninja
+from functools import lru_cache
+
+try:
+    import pymupdf
+except ImportError:
+    pymupdf = None
+
+
+def pdfium_text_pages(path):
+    """
+    Yields the plain text of each page in a PDF file using PDFium.
+    """
+    pdf = pypdfium2.PdfDocument(path)
+    try:
+        for page in pdf:
+            textpage = page.get_textpage()
+            text = textpage.get_text_range()
+            textpage.close()
+            page.close()
+            yield text
+    finally:
+        pdf.close()
+
+
+def pymupdf_text_pages(path):
+    """
+    Yields the plain text of each page in a PDF file using PyMuPDF (MuPDF's native text extractor).
+    Text is read in layout order with column padding collapsed, so each table row comes out
+    on one space-separated line as it does with PDFium.
+    """
+    with pymupdf.open(path) as doc:
+        for page in doc:
+            lines = (' '.join(line.split()) for line in page.get_text("text", sort=True).splitlines())
+            yield '\n'.join(line for line in lines if line)
+
+
+def map_pdfs_in_directory(directory_path, func):
+    """
+    Applies func to every PDF file in a directory, one worker process per file.
+    Returns the results in directory listing order.
+    """
+    file_paths = []
+    with os.scandir(directory_path) as entries:
+        for entry in entries:
+            if entry.is_file() and entry.name.endswith('.pdf'):
+                print(f"Found file: {entry.name}")
+                file_paths.append(entry.path)
+
+    # Files are independent and parsing is CPU-bound, so extract them in parallel
+    with ProcessPoolExecutor() as executor:
+        return list(executor.map(func, file_paths))
+
+
+# PyMuPDF is used when it is installed, PDFium otherwise
+extract_text_pages = pymupdf_text_pages if pymupdf else pdfium_text_pages
+
+
+@lru_cache(maxsize=200_000)
+def _split_cached(text):
+    """
+    Memoized wordninja segmentation of a single concatenated token.
+    """
+    return " ".join(wordninja.split(text))
+
+
+def split_concatenated_text(text):
+    """
+    Splits concatenated text into readable words using wordninja.
+    Each whitespace-separated token is segmented on its own, so merchant names
+    repeated across statements are only segmented once.
+    """
+    return " ".join(filter(None, map(_split_cached, text.split())))
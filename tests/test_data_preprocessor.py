@@ -0,0 +1,23 @@
+from core.data_preprocessor import DataProcessor
+
+
+def test_process_pdf_without_transactions_returns_empty_frame(monkeypatch):
+    processor = DataProcessor()
+    monkeypatch.setattr(processor, '_extract_lines', lambda file_path: iter([['Statement for 2024'], []]))
+
+    df = processor.process_pdf('statement.pdf')
+
+    assert df.empty
+    assert {'date', 'description', 'category', 'transaction_type'} <= set(df.columns)
+
+
+def test_process_pdf_parses_transaction_lines(monkeypatch):
+    processor = DataProcessor()
+    lines = ['Statement for 2024', 'Jan03 WALMART 12.50 1,000.00', 'Jan04 Deposit REFUND 5.00 1,005.00']
+    monkeypatch.setattr(processor, '_extract_lines', lambda file_path: iter([lines]))
+
+    df = processor.process_pdf('statement.pdf')
+
+    assert list(df['transaction_type']) == ['withdrawal', 'deposit']
+    assert list(df['category']) == ['Groceries', 'Refunds']
+    assert list(df['balance']) == [1000.0, 1005.0]
@@ -0,0 +1,38 @@
+import extract_credits
+
+
+def patch_pages(monkeypatch, pages):
+    monkeypatch.setattr(extract_credits, 'extract_text_pages', lambda pdf_file: iter(pages))
+
+
+def test_year_found_past_header_window(monkeypatch):
+    text = 'x' * extract_credits._YEAR_SEARCH_WINDOW + ' Statement date Jan 31, 2024\n001 Jan 03 Jan 04 AMAZON 12.50'
+    patch_pages(monkeypatch, [text])
+
+    df = extract_credits.extract_transactions_from_pdf('credit.pdf')
+
+    assert list(df['date']) == ['Jan 03 2024']
+
+
+def test_extract_transactions_from_pdf(monkeypatch):
+    pages = [
+        ' Statement date Jan 31, 2024\n001 Jan 03 Jan 04  AMAZON MKTP  1,212.50\n',
+        '002 Jan 05 Jan 06 PAYMENT THANK YOU 300.00-\n',
+    ]
+    patch_pages(monkeypatch, pages)
+
+    df = extract_credits.extract_transactions_from_pdf('credit.pdf')
+
+    assert list(df['date']) == ['Jan 03 2024', 'Jan 05 2024']
+    assert list(df['description']) == ['AMAZON MKTP', 'PAYMENT THANK YOU']
+    assert df['amount'].dtype == 'float64'
+    assert list(df['amount']) == [1212.5, 300.0]
+
+
+def test_page_without_transactions_gives_empty_frame(monkeypatch):
+    patch_pages(monkeypatch, ['Nothing to see here'])
+
+    df = extract_credits.extract_transactions_from_pdf('credit.pdf')
+
+    assert df.empty
+    assert list(df.columns) == ['date', 'description', 'amount']
@@ -0,0 +1,59 @@
+import pandas as pd
+
+import extract_transactions
+from extract_transactions import extract_transactions_from_page
+
+
+def test_trailing_marker_is_ignored():
+    transactions = extract_transactions_from_page(['Jan03 WALMART 12.50 1,000.00 CR'], '2024')
+
+    assert transactions == [['Jan03', 'WALMART', '12.50', None, '1,000.00', '2024']]
+
+
+def test_deposit_trigger_marks_deposit():
+    transactions = extract_transactions_from_page(['Jan04 MB-Transferfrom SAVINGS 50.00 1,050.00'], '2024')
+
+    assert transactions[0][2] is None
+    assert transactions[0][3] == '50.00'
+
+
+def test_opening_balance_line():
+    transactions = extract_transactions_from_page(['Mar01 OpeningBalance 1,000.00'], '2024')
+
+    assert transactions == [['Mar01', '', 'OpeningBalance', None, '1,000.00', '2024']]
+
+
+def test_continuation_line_extends_description():
+    lines = ['Jan03 WALMART 12.50 1,000.00', 'STORE']
+
+    transactions = extract_transactions_from_page(lines, '2024')
+
+    assert transactions[0][1] == 'WALMART STORE'
+
+
+def test_process_single_pdf(monkeypatch):
+    pages = [
+        'Jan02 EARLY 1.00 99.00',
+        '\n'.join([
+            'Statement for 2024',
+            'Mar01 OpeningBalance 1,000.00',
+            'Mar03 WALMART 1,012.50 987.50',
+            'Feb30 BOGUS 1.00 2.00',
+            'Mar04 Deposit REFUND 5.00 992.50',
+            'Mar31 ClosingBalance 992.50',
+        ]),
+    ]
+    monkeypatch.setattr(extract_transactions, 'extract_text_pages', lambda file_path: iter(pages))
+
+    df = extract_transactions.process_single_pdf('statement.pdf')
+
+    assert list(df.columns) == ['Date', 'Description', 'Withdrawals ($)', 'Deposits ($)', 'Balance ($)']
+    # Rows before the year is known stay undated; unparseable dates are dropped
+    assert pd.isna(df['Date'][0])
+    assert list(df['Date'][1:]) == list(pd.to_datetime(['2024-03-01', '2024-03-03', '2024-03-04', '2024-03-31']))
+    assert list(df['Description'][1:]) == ['Opening Balance', 'WALMART', 'Deposit REFUND', 'Closing Balance']
+    assert (df[['Withdrawals ($)', 'Deposits ($)', 'Balance ($)']].dtypes == 'float64').all()
+    assert df['Withdrawals ($)'][2] == 1012.5
+    assert df['Withdrawals ($)'][[1, 4]].isna().all()
+    assert df['Deposits ($)'][3] == 5.0
+    assert df['Balance ($)'].tolist() == [99.0, 1000.0, 987.5, 992.5, 992.5]
@@ -0,0 +1,95 @@
+import pytest
+
+import extract_credits
+import extract_transactions
+import pdf_text
+
+fpdf = pytest.importorskip('fpdf')
+
+
+def pdfplumber_text_pages(path):
+    pdfplumber = pytest.importorskip('pdfplumber')
+    with pdfplumber.open(path) as pdf:
+        for page in pdf.pages:
+            yield page.extract_text() or ''
+
+
+def pymupdf_text_pages(path):
+    if pdf_text.pymupdf is None:
+        pytest.skip('PyMuPDF is not installed')
+    return pdf_text.pymupdf_text_pages(path)
+
+
+BACKENDS = [pdf_text.pdfium_text_pages, pymupdf_text_pages]
+
+
+def write_table_pdf(path, header, rows, widths):
+    """Writes a one-page PDF with each row laid out as separately positioned cells."""
+    pdf = fpdf.FPDF()
+    pdf.add_page()
+    pdf.set_font('Helvetica', size=10)
+    pdf.cell(0, 8, header, new_x='LMARGIN', new_y='NEXT')
+    for row in rows:
+        for width, text in zip(widths, row):
+            pdf.cell(width, 8, text)
+        pdf.ln(8)
+    pdf.output(str(path))
+    return str(path)
+
+
+@pytest.fixture
+def statement_pdf(tmp_path):
+    rows = [
+        ('Jan03', 'WALMART STORE #123', '12.50', '1,000.00'),
+        ('Jan04', 'Deposit PAYROLL', '500.00', '1,500.00'),
+        ('Jan05', 'NETFLIX', '15.99', '1,484.01'),
+    ]
+    return write_table_pdf(tmp_path / 'statement.pdf', 'Statement for January 2024', rows, (25, 80, 30, 30))
+
+
+@pytest.fixture
+def credit_pdf(tmp_path):
+    rows = [
+        ('001', 'Jan 03', 'Jan 04', 'AMAZON MKTP', '1,212.50'),
+        ('002', 'Jan 05', 'Jan 06', 'PAYMENT THANK YOU', '300.00-'),
+    ]
+    return write_table_pdf(tmp_path / 'credit.pdf', 'Statement date Jan 31, 2024', rows, (15, 20, 20, 70, 30))
+
+
+@pytest.mark.parametrize('backend', BACKENDS)
+def test_transactions_match_across_backends(backend, statement_pdf, monkeypatch):
+    monkeypatch.setattr(extract_transactions, 'extract_text_pages', pdfplumber_text_pages)
+    expected = extract_transactions.process_single_pdf(statement_pdf)
+    monkeypatch.setattr(extract_transactions, 'extract_text_pages', backend)
+
+    df = extract_transactions.process_single_pdf(statement_pdf)
+
+    assert len(expected) == 3
+    assert df.equals(expected)
+
+
+@pytest.mark.parametrize('backend', BACKENDS)
+def test_credits_match_across_backends(backend, credit_pdf, monkeypatch):
+    monkeypatch.setattr(extract_credits, 'extract_text_pages', pdfplumber_text_pages)
+    expected = extract_credits.extract_transactions_from_pdf(credit_pdf)
+    monkeypatch.setattr(extract_credits, 'extract_text_pages', backend)
+
+    df = extract_credits.extract_transactions_from_pdf(credit_pdf)
+
+    assert len(expected) == 2
+    assert df.equals(expected)
+
+
+def test_process_all_pdfs_in_directory(statement_pdf, tmp_path):
+    (tmp_path / 'notes.txt').write_text('Jan03 NOT A PDF 1.00 2.00')
+
+    df = extract_transactions.process_all_pdfs_in_directory(str(tmp_path))
+
+    assert df.equals(extract_transactions.process_single_pdf(statement_pdf))
+
+
+def test_process_all_pdfs_in_empty_directory(tmp_path):
+    df = extract_credits.process_all_pdfs_in_directory(str(tmp_path))
+
+    assert df.empty
+    assert list(df.columns) == ['date', 'description', 'amount']
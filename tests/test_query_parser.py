@@ -0,0 +1,137 @@
+import pytest
+import numpy as np
+import pandas as pd
+
+from core.query_parser import TransactionQueryParser
+
+
+def make_parser(**overrides):
+    data = {
+        'date': ['2024-01-03', '2024-01-05', '2024-01-04'],
+        'description': ['WALMART', None, 1234],
+        'withdrawals': [12.5, np.nan, 40.0],
+        'deposits': [np.nan, 100.0, np.nan],
+    }
+    data.update(overrides)
+    return TransactionQueryParser(pd.DataFrame(data))
+
+
+def test_filter_by_description_handles_non_string_descriptions():
+    parser = make_parser()
+
+    df = parser.filter_by_description(['walmart', '123'])
+
+    assert list(df['description']) == ['WALMART', 1234]
+
+
+def test_filter_by_description_empty_keyword_matches_all_described_rows():
+    parser = make_parser()
+
+    df = parser.filter_by_description('')
+
+    assert len(df) == 2
+    assert df['description'].notna().all()
+
+
+def test_parse_relative_dates_this_month_starts_on_first_day():
+    start_date, end_date = TransactionQueryParser.parse_relative_dates('this month')
+
+    today = pd.Timestamp.now()
+    assert start_date == today.replace(day=1).strftime('%Y-%m-%d')
+    assert end_date == today.strftime('%Y-%m-%d')
+
+
+def test_get_largest_transaction_returns_row():
+    parser = make_parser()
+
+    largest = parser.get_largest_transaction('withdrawals')
+
+    assert largest['withdrawals'] == 40.0
+    assert largest['description'] == 1234
+
+
+def test_get_largest_transaction_returns_none_when_column_empty():
+    parser = make_parser(deposits=[np.nan, np.nan, np.nan])
+
+    assert parser.get_largest_transaction('deposits') is None
+
+
+def test_get_largest_transaction_rejects_invalid_type():
+    parser = make_parser()
+
+    with pytest.raises(ValueError):
+        parser.get_largest_transaction('balance')
+
+
+def make_dated_parser():
+    # Unsorted, with a duplicate date and a row whose date is missing
+    return make_parser(
+        date=['2024-01-05', None, '2024-01-03', '2024-01-04', '2024-01-04'],
+        description=['A', 'B', 'C', 'D', 'E'],
+        withdrawals=[1.0, 2.0, 3.0, 4.0, 5.0],
+        deposits=[np.nan] * 5,
+    )
+
+
+def filtered_descriptions(parser, start_date=None, end_date=None):
+    return list(parser.filter_by_date(start_date, end_date)['description'])
+
+
+def test_filter_by_date_without_bounds_keeps_every_row_sorted():
+    assert filtered_descriptions(make_dated_parser()) == ['C', 'D', 'E', 'A', 'B']
+
+
+def test_filter_by_date_start_only():
+    assert filtered_descriptions(make_dated_parser(), start_date='2024-01-04') == ['D', 'E', 'A']
+
+
+def test_filter_by_date_end_only():
+    assert filtered_descriptions(make_dated_parser(), end_date='2024-01-04') == ['C', 'D', 'E']
+
+
+def test_filter_by_date_start_equals_end():
+    assert filtered_descriptions(make_dated_parser(), '2024-01-04', '2024-01-04') == ['D', 'E']
+
+
+def test_filter_by_date_start_after_end_is_empty():
+    assert filtered_descriptions(make_dated_parser(), '2024-01-05', '2024-01-03') == []
+
+
+def test_filter_by_date_bounds_outside_data():
+    parser = make_dated_parser()
+
+    assert filtered_descriptions(parser, start_date='2023-12-01') == ['C', 'D', 'E', 'A']
+    assert filtered_descriptions(parser, end_date='2024-02-01') == ['C', 'D', 'E', 'A']
+    assert filtered_descriptions(parser, start_date='2024-02-01') == []
+    assert filtered_descriptions(parser, end_date='2023-12-01') == []
+
+
+def test_repeated_date_filter_hits_cache():
+    parser = make_dated_parser()
+
+    first = parser.filter_by_date('2024-01-04', '2024-01-05')
+    second = parser.filter_by_date('2024-01-04', '2024-01-05')
+
+    assert parser._date_bounds.cache_info().hits == 1
+    assert second.equals(first)
+
+
+def test_repeated_description_filter_hits_cache():
+    parser = make_parser()
+
+    first = parser.filter_by_description('walmart')
+    second = parser.filter_by_description('walmart')
+
+    assert parser._description_mask.cache_info().hits == 1
+    assert second.equals(first)
+
+
+def test_description_keywords_share_cache_key():
+    parser = make_parser()
+
+    first = parser.filter_by_description(['Walmart', 'walmart'])
+    second = parser.filter_by_description('walmart')
+
+    info = parser._description_mask.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+    assert second.equals(first)